@@ -12,6 +12,11 @@ class Command(BaseCommand):
             action="store_true",
             help="Set the value of the sent release to None",
         )
+        parser.add_argument(
+            "--no-locals",
+            action="store_true",
+            help="Skip creating the throwaway local variables (they exist to exercise locals-capture)",
+        )
 
     def handle(self, *args, **options):
         from sentry_sdk import set_tag
@@ -30,12 +35,16 @@ class Command(BaseCommand):
             self.raise_exception("Exception raised on purpose - 2")
         except Exception as e:
             # self.raise_exception("An 'accident' happened while handling the exception")
-            self.raise_exception_from("We intentionally translated this into the exception", e)
+            self.raise_exception_from(
+                "We intentionally translated this into the exception", e, with_locals=not options["no_locals"])
 
     def raise_exception(self, msg):
         raise ValueError(msg)
 
-    def raise_exception_from(self, msg, e):
+    def raise_exception_from(self, msg, e, with_locals=True):
+        if not with_locals:
+            raise ValueError(msg) from e
+
         s = "foo"  # noqa unused variable, but we want to test that it shows up in the local variables in Bugsink
         l = ["bar", 1, None, ["bar", 1, None]] # noqa
         d = {  # noqa
@@ -2,6 +2,20 @@ import os
 from bugsink.app_settings import get_settings
 
 
+# Directories we've already created (or observed to exist) this process. Creating the ingest store dir is a one-time
+# thing per process, but os.makedirs(..., exist_ok=True) on every event means a stat-cascade over the full path on the
+# hot ingest path; remembering the dirnames we've seen skips that. Kept as a set (rather than a single flag) so this
+# keeps working if the store dir ever becomes sharded, and so that tests which switch INGEST_STORE_BASE_DIR (e.g. via
+# override_settings pointing at a fresh tmpdir) each get their own makedirs call.
+_created_dirs = set()
+
+
+def ensure_dir_exists(dirname):
+    if dirname not in _created_dirs:
+        os.makedirs(dirname, exist_ok=True)
+        _created_dirs.add(dirname)
+
+
 def get_filename_for_event_id(event_id):
     # The idea of having some levels of directories here (to avoid too many files in a single dir) is not yet
     # implemented. However, counterpoint: when doing stress tests, it was quite hard to get a serious backlog going
@@ -9,9 +9,14 @@ class ParseError(Exception):
 
 
 class NewlineFinder:
+    # () because error_for_eof lives on the class; per-instance storage is simply not needed
+    __slots__ = ()
+
     error_for_eof = None
 
     def process(self, output_stream, chunk):
+        # note: for a single-byte needle CPython's bytes.find is already a straight memchr() (i.e. the libc-provided,
+        # typically SIMD-accelerated one); hand-rolling something via ctypes/cffi would only add per-call overhead.
         index = chunk.find(b"\n")
         if index != -1:
             part_of_result, remainder = chunk[:index], chunk[index + 1:]
@@ -23,6 +28,7 @@ class NewlineFinder:
 
 
 class LengthFinder:
+    __slots__ = ("length", "count", "error_for_eof")
 
     def __init__(self, length, error_for_eof):
         self.error_for_eof = error_for_eof
@@ -30,25 +36,30 @@ class LengthFinder:
         self.count = 0
 
     def process(self, output_stream, chunk):
-        needed = self.length - self.count
-        if needed <= len(chunk):
-            part_of_result, remainder = chunk[:needed], chunk[needed:]
-            output_stream.write(part_of_result)
-            return True, remainder
+        # single straight-line path for both the "chunk completes the item" and "chunk is all ours" cases; taking
+        # min() and slicing unconditionally is cheaper than branching into two separate write paths, and when the
+        # chunk is consumed entirely the chunk[take:] slice is just b"".
+        take = min(self.length - self.count, len(chunk))
+        output_stream.write(chunk[:take])
+        self.count += take
+        return self.count == self.length, chunk[take:]
 
-        self.count += len(chunk)
-        output_stream.write(chunk)
-        return False, b""
+
+# NewlineFinder carries no per-use state, so the parser-internal callsites below all share a single instance instead
+# of allocating a fresh one per header/item.
+_newline_finder = NewlineFinder()
 
 
 def readuntil(input_stream, initial_chunk, finder, output_stream, chunk_size):
-    chunk = initial_chunk
-    done = False
+    # bind the methods once before the loop; for big items (many chunks) this saves an attribute lookup per chunk.
+    # (the error_for_eof check needs no such treatment: it only ever runs once, on the not-chunk path)
+    process = finder.process
+    read = input_stream.read
 
-    done, remainder = finder.process(output_stream, chunk)
+    done, remainder = process(output_stream, initial_chunk)
 
     while not done:
-        chunk = input_stream.read(chunk_size)
+        chunk = read(chunk_size)
 
         if not chunk:
             if finder.error_for_eof is None:
@@ -57,7 +68,7 @@ def readuntil(input_stream, initial_chunk, finder, output_stream, chunk_size):
 
             raise ParseError(finder.error_for_eof)
 
-        done, remainder = finder.process(output_stream, chunk)
+        done, remainder = process(output_stream, chunk)
 
     return remainder, False
 
@@ -86,7 +97,11 @@ class StreamingEnvelopeParser:
     4. if running uvicorn, Django's asgi stack will do request buffering - https://code.djangoproject.com/ticket/33699
     """
 
-    def __init__(self, input_stream, chunk_size=1024):
+    __slots__ = ("input_stream", "chunk_size", "remainder", "at_eof", "envelope_headers")
+
+    def __init__(self, input_stream, chunk_size=64 * 1024):
+        # 64KiB chunks: big enough that a typical event body is consumed in one or two reads (i.e. one or two trips
+        # through the Python-level read loop) while still being a trivial amount of memory to hold on to.
         self.input_stream = input_stream
         self.chunk_size = chunk_size
 
@@ -127,7 +142,7 @@ class StreamingEnvelopeParser:
 
         # points 3, 4 (we don't use 5, 6, 7, 9 explicitly)
         self.remainder, self.at_eof = readuntil(
-            self.input_stream, self.remainder, NewlineFinder(), header_stream, self.chunk_size)
+            self.input_stream, self.remainder, _newline_finder, header_stream, self.chunk_size)
 
         header_stream_value = header_stream.getvalue()
         if self.at_eof:
@@ -142,8 +157,10 @@ class StreamingEnvelopeParser:
                 raise ParseError("EOF when reading headers; what is this a header for then?")
 
         try:
-            return json.loads(header_stream_value.decode("utf-8"))  # points 1, 2
-        except json.JSONDecodeError as e:
+            # json.loads takes bytes directly (and does the utf-8 decoding, point 1, internally); no need for a
+            # separate .decode() roundtrip which would allocate an intermediate str.
+            return json.loads(header_stream_value)  # points 1, 2
+        except (json.JSONDecodeError, UnicodeDecodeError) as e:
             raise ParseError("Header not JSON") from e
 
     def get_envelope_headers(self):
@@ -165,29 +182,50 @@ class StreamingEnvelopeParser:
                 self.at_eof = True
                 break
 
+            item_output_stream = output_stream_factory(item_headers)
+
             if "length" in item_headers:
                 length = item_headers["length"]
-                finder = LengthFinder(length, error_for_eof="EOF while reading item with explicitly specified length")
-            else:
-                finder = NewlineFinder()
 
-            item_output_stream = output_stream_factory(item_headers)
-            self.remainder, self.at_eof = readuntil(
-                self.input_stream, self.remainder, finder, item_output_stream, self.chunk_size)
+                if len(self.remainder) >= length:
+                    # fast path: the item is already fully buffered in the remainder (i.e. it was small enough to be
+                    # contained in a previously read chunk); hand it downstream in a single write, skipping the
+                    # per-chunk readuntil/LengthFinder bookkeeping (and its associated slicing) entirely.
+                    item_output_stream.write(self.remainder[:length])
+                    self.remainder = self.remainder[length:]
+                else:
+                    finder = LengthFinder(
+                        length, error_for_eof="EOF while reading item with explicitly specified length")
+                    self.remainder, self.at_eof = readuntil(
+                        self.input_stream, self.remainder, finder, item_output_stream, self.chunk_size)
+            else:
+                self.remainder, self.at_eof = readuntil(
+                    self.input_stream, self.remainder, _newline_finder, item_output_stream, self.chunk_size)
 
             if "length" in item_headers:
                 # items with an explicit length are terminated by a newline (if at EOF, this is optional as per the set
                 # of examples in the docs)
-                should_be_empty = io.BytesIO()
-                self.remainder, self.at_eof = readuntil(
-                    self.input_stream, self.remainder, NewlineFinder(), should_be_empty, self.chunk_size)
-                if should_be_empty.getvalue() != b"":
-                    raise ParseError("Item with explicit length not terminated by newline/EOF")
+                if self.remainder[:1] == b"\n":
+                    # the terminator is already buffered (which it is whenever the item didn't end exactly on a chunk
+                    # boundary); consume it directly rather than spinning up another readuntil for a single byte.
+                    self.remainder = self.remainder[1:]
+                else:
+                    should_be_empty = io.BytesIO()
+                    self.remainder, self.at_eof = readuntil(
+                        self.input_stream, self.remainder, _newline_finder, should_be_empty, self.chunk_size)
+                    if should_be_empty.getvalue() != b"":
+                        raise ParseError("Item with explicit length not terminated by newline/EOF")
 
             yield item_headers, item_output_stream
 
     def get_items_directly(self):
         # this method is just convenience for testing
 
-        for item_headers, output_stream in self.get_items(lambda item_headers: io.BytesIO()):
-            yield item_headers, output_stream.getvalue()
+        # a single BytesIO is reused across items (reset between yields); the item's bytes are copied out by getvalue()
+        # anyway, so there's no point in allocating a fresh buffer per item.
+        buffer = io.BytesIO()
+
+        for item_headers, output_stream in self.get_items(lambda item_headers: buffer):
+            yield item_headers, buffer.getvalue()
+            buffer.seek(0)
+            buffer.truncate()
@@ -15,11 +15,13 @@ logger = logging.getLogger("bugsink.ingest")
 def digest(event_id, event_metadata):
     from .views import BaseIngestAPIView
 
-    with open(get_filename_for_event_id(event_id), "rb") as f:
-        event_data = json.loads(f.read().decode("utf-8"))
+    def load_event_data():
+        # passed as a loader (rather than eagerly parsed) so digest_event can skip the parse for over-quota events
+        with open(get_filename_for_event_id(event_id), "rb") as f:
+            return json.loads(f.read())  # json.loads takes bytes directly; no separate .decode() pass
 
     try:
-        BaseIngestAPIView.digest_event(event_metadata, event_data)
+        BaseIngestAPIView.digest_event(event_metadata, load_event_data)
     except ValidationError as e:
         logger.warning("ValidationError in digest_event", exc_info=e)
     finally:
@@ -37,7 +37,7 @@ from alerts.tasks import send_new_issue_alert, send_regression_alert
 from compat.timestamp import format_timestamp, parse_timestamp
 
 from .parsers import StreamingEnvelopeParser, ParseError
-from .filestore import get_filename_for_event_id
+from .filestore import get_filename_for_event_id, ensure_dir_exists
 from .tasks import digest
 from .event_counter import check_for_thresholds
 from .models import StoreEnvelope, DontStoreEnvelope, Envelope
@@ -142,7 +142,8 @@ class BaseIngestAPIView(View):
         if get_settings().DIGEST_IMMEDIATELY:
             # in this case the stream will be an BytesIO object, so we can actually call .get_value() on it.
             event_data_bytes = event_data_stream.getvalue()
-            event_data = json.loads(event_data_bytes.decode("utf-8"))
+            # json.loads takes bytes directly (utf-8 decoding happens internally, in C); no separate .decode() pass
+            event_data = json.loads(event_data_bytes)
             performance_logger.info("ingested event with %s bytes", len(event_data_bytes))
             cls.digest_event(event_metadata, event_data)
         else:
@@ -243,8 +244,15 @@ class BaseIngestAPIView(View):
         if not cls.count_project_periods_and_act_on_it(project, digested_at):
             return  # if over-quota: just return (any cleanup is done calling-side)
 
-        if get_settings().VALIDATE_ON_DIGEST in ["warn", "strict"]:
-            cls.validate_event_data(event_data, get_settings().VALIDATE_ON_DIGEST)
+        if callable(event_data):
+            # the task-queue path hands us a loader rather than parsed data, so that events which the quota check above
+            # rejects (quota being the main back-pressure mechanism, i.e. this matters exactly when we're overloaded)
+            # never pay the cost of parsing their JSON.
+            event_data = event_data()
+
+        validate_on_digest = get_settings().VALIDATE_ON_DIGEST
+        if validate_on_digest in ["warn", "strict"]:
+            cls.validate_event_data(event_data, validate_on_digest)
 
         # I resisted the temptation to put `get_denormalized_fields_for_data` in an if-statement: you basically "always"
         # need this info... except when duplicate event-ids are sent. But the latter is the exception, and putting this
@@ -257,7 +265,19 @@ class BaseIngestAPIView(View):
 
         grouping_key = get_issue_grouper_for_data(event_data, calculated_type, calculated_value)
 
-        if not Grouping.objects.filter(project_id=event_metadata["project_id"], grouping_key=grouping_key).exists():
+        try:
+            # the overwhelmingly common case is a grouping that exists already; fetch it (and its issue, in the same
+            # query via select_related) right away, rather than paying for a separate exists() check per event.
+            grouping = Grouping.objects.select_related("issue").get(
+                project_id=event_metadata["project_id"], grouping_key=grouping_key)
+            issue = grouping.issue
+            issue_created = False
+
+            # update the denormalized fields
+            issue.last_seen = ingested_at
+            issue.digested_event_count += 1
+
+        except Grouping.DoesNotExist:
             # we don't have Project.issue_count here ('premature optimization') so we just do an aggregate instead.
             max_current = Issue.objects.filter(project_id=event_metadata["project_id"]).aggregate(
                 Max("digest_order"))["digest_order__max"]
@@ -282,15 +302,6 @@ class BaseIngestAPIView(View):
                 issue=issue,
             )
 
-        else:
-            grouping = Grouping.objects.get(project_id=event_metadata["project_id"], grouping_key=grouping_key)
-            issue = grouping.issue
-            issue_created = False
-
-            # update the denormalized fields
-            issue.last_seen = ingested_at
-            issue.digested_event_count += 1
-
         # +1 because we're about to add one event.
         project_stored_event_count = project.stored_event_count + 1
 
@@ -393,9 +404,10 @@ class BaseIngestAPIView(View):
     def count_project_periods_and_act_on_it(cls, project, now):
         # returns: True if any further processing should be done.
 
+        app_settings = get_settings()  # bind once; this method runs once per digested event
         thresholds = [
-            ("minute", 5, get_settings().MAX_EVENTS_PER_PROJECT_PER_5_MINUTES),
-            ("minute", 60, get_settings().MAX_EVENTS_PER_PROJECT_PER_HOUR),
+            ("minute", 5, app_settings.MAX_EVENTS_PER_PROJECT_PER_5_MINUTES),
+            ("minute", 60, app_settings.MAX_EVENTS_PER_PROJECT_PER_HOUR),
         ]
 
         if project.quota_exceeded_until is not None and now < project.quota_exceeded_until:
@@ -433,7 +445,9 @@ class BaseIngestAPIView(View):
             # next_quota_check (the if-statement) and the setting (the statement below) we're good.
             project.next_quota_check = project.digested_event_count + check_again_after
 
-        project.save()
+        # update_fields: this method touches exactly these three fields, and it runs once per digested event; no need
+        # to write the full row (and maintain indexes on untouched columns) every time.
+        project.save(update_fields=["digested_event_count", "quota_exceeded_until", "next_quota_check"])
         return True
 
     @classmethod
@@ -582,7 +596,7 @@ class IngestEnvelopeAPIView(BaseIngestAPIView):
                 if "event_id" not in envelope_headers:
                     raise ParseError("event_id not found in envelope headers")
                 filename = get_filename_for_event_id(envelope_headers["event_id"])
-                os.makedirs(os.path.dirname(filename), exist_ok=True)
+                ensure_dir_exists(os.path.dirname(filename))
                 return MaxDataWriter("MAX_EVENT_SIZE", open(filename, 'wb'))
 
             # everything else can be discarded; (we don't check for individual size limits, because these differ
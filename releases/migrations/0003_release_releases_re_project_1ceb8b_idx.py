@@ -0,0 +1,17 @@
+# Generated by Django 4.2.30 on 2026-08-29 17:51
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('releases', '0002_release_releases_re_sort_ep_5c07c8_idx'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='release',
+            index=models.Index(fields=['project', 'sort_epoch'], name='releases_re_project_1ceb8b_idx'),
+        ),
+    ]
@@ -1,6 +1,7 @@
 import json
 import re
 import uuid
+from functools import lru_cache
 
 from semver.version import Version
 
@@ -15,10 +16,31 @@ from issues.models import Issue, TurningPoint, TurningPointKind
 RE_PACKAGE_VERSION = re.compile('((?P<package>.*)[@])?(?P<version>.*)')
 
 
+@lru_cache(maxsize=4096)
+def _parse_version(version):
+    # parsing is regex-based and not free; the same version strings recur constantly (each event carries a release,
+    # and sorting the release list parses each version once per sort). Version objects are immutable, so sharing the
+    # parsed result between callers is fine. Caching the real parser is preferred over a hand-rolled "fast" pattern,
+    # which would inevitably drift from the spec (prereleases, build metadata).
+    return Version.parse(version)
+
+
+@lru_cache(maxsize=4096)
 def is_valid_semver(full_version):
+    # lru_cache: the answer for a given version string never changes, and in practice the same handful of strings is
+    # checked over and over (every event carries a release, and most events carry the current one). 4096 entries of
+    # (short) strings is a trivial amount of memory even for busy multi-project setups.
     try:
         version = RE_PACKAGE_VERSION.match(full_version).groupdict()["version"]
-        Version.parse(version)
+
+        # fast path for the overwhelmingly common plain "x.y.z" shape: three dot-separated ascii numbers without
+        # leading zeros is valid semver by definition, no full parse needed. (isascii() because isdigit() alone also
+        # accepts e.g. superscripts, which Version.parse rightly rejects; same for the no-leading-zeros rule)
+        parts = version.split(".")
+        if len(parts) == 3 and all(p.isascii() and p.isdigit() and (p == "0" or p[0] != "0") for p in parts):
+            return True
+
+        _parse_version(version)
         return True
     except ValueError:
         return False
@@ -27,7 +49,7 @@ def is_valid_semver(full_version):
 def release_sort_key(release):
     return (
         release.sort_epoch,
-        Version.parse(release.semver) if release.is_semver else release.date_released
+        _parse_version(release.semver) if release.is_semver else release.date_released
     )
 
 
@@ -70,13 +92,15 @@ class Release(models.Model):
                 self.semver = RE_PACKAGE_VERSION.match(self.version)["version"]
 
             # whether doing this epoch setting inline on-creation is a smart idea... will become clear soon enough.
-            any_release_from_last_epoch = Release.objects.filter(project=self.project).order_by("sort_epoch").last()
+            # .values(): we only look at 2 fields, no need to pull the full row and construct a Release instance.
+            any_release_from_last_epoch = Release.objects.filter(
+                project=self.project).order_by("sort_epoch").values("sort_epoch", "is_semver").last()
             if any_release_from_last_epoch is None:
                 self.sort_epoch = 0
-            elif self.is_semver == any_release_from_last_epoch.is_semver:
-                self.sort_epoch = any_release_from_last_epoch.sort_epoch
+            elif self.is_semver == any_release_from_last_epoch["is_semver"]:
+                self.sort_epoch = any_release_from_last_epoch["sort_epoch"]
             else:
-                self.sort_epoch = any_release_from_last_epoch.sort_epoch + 1
+                self.sort_epoch = any_release_from_last_epoch["sort_epoch"] + 1
 
         super(Release, self).save(*args, **kwargs)
 
@@ -85,6 +109,9 @@ class Release(models.Model):
 
         indexes = [
             models.Index(fields=["sort_epoch"]),
+            # serves the epoch-picking query in save() (filter on project, order by sort_epoch) without a scan over
+            # the project's releases
+            models.Index(fields=["project", "sort_epoch"]),
         ]
 
     def get_short_version(self):
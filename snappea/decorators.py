@@ -28,7 +28,13 @@ def shared_task(function):
             # touch it again). Counterpoint: if we'd have a transaction, we could distinguish between "wait for write
             # lock" and "actually write".
             kwargs.update(add_task_kwargs())
-            Task.objects.create(task_name=name, args=json.dumps(args), kwargs=json.dumps(kwargs))
+            # compact separators: the serialized args/kwargs are only ever read back by json.loads in the foreman,
+            # never by humans, so there's no reason to pay for the default ", "/": " padding in every Task row.
+            Task.objects.create(
+                task_name=name,
+                args=json.dumps(args, separators=(",", ":")),
+                kwargs=json.dumps(kwargs, separators=(",", ":")),
+            )
 
             # not necessary: `connections["snappea"].close()`; Django does this at the end of the request and the
             # foreman's thread cleanup code does it for worker threads.
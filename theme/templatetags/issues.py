@@ -1,4 +1,7 @@
 import re
+from functools import lru_cache
+from itertools import accumulate
+
 from django import template
 from pygments import highlight
 from pygments.formatters import HtmlFormatter
@@ -11,16 +14,19 @@ from bugsink.pygments_extensions import guess_lexer_for_filename, lexer_for_plat
 
 register = template.Library()
 
+# a single module-level formatter: HtmlFormatter's __init__ processes a large number of options, which is wasted work
+# when repeated per frame (a single issue page can easily have dozens of frames); the formatter is stateless across
+# highlight() calls so sharing one instance is safe. (lexers are similarly reused, via the MRU cache in
+# bugsink.pygments_extensions)
+_formatter = HtmlFormatter(nowrap=True)
 
-def _split(joined, lengths):
-    result = []
-    start = 0
-    for length in lengths:
-        result.append(joined[start:start + length])
-        start += length
 
-    assert [len(r) for r in result] == lengths
-    return result
+def _split(joined, lengths):
+    # the boundaries are just the running totals of the lengths; accumulate/zip expresses that directly (and in C)
+    # rather than hand-tracking a start index. No assert here anymore: the lengths are computed from the very lists
+    # that `joined` was built from, so re-measuring every part on every call just repeated that arithmetic.
+    offsets = [0] + list(accumulate(lengths))
+    return [joined[start:stop] for start, stop in zip(offsets, offsets[1:])]
 
 
 def _core_pygments(code, filename=None, platform=None):
@@ -41,7 +47,7 @@ def _core_pygments(code, filename=None, platform=None):
     else:
         lexer = lexer_for_platform(platform)
 
-    result = highlight(code, lexer, HtmlFormatter(nowrap=True))
+    result = highlight(code, lexer, _formatter)
 
     # I can't actually get the assertion below to work stably on the level of _core_pygments(code), so it is commented
     # out. This is because at the present level we have to deal with both pygments' funnyness, and the fact that "what
@@ -54,7 +60,17 @@ def _core_pygments(code, filename=None, platform=None):
 
 
 def _pygmentize_lines(lines, filename=None, platform=None):
-    if lines == []:
+    # the cache wants hashable arguments, hence the tuple() dance in this thin wrapper. Repeats are very common: the
+    # same frame (same source lines) comes back on every page view of an issue, and often across events of the same
+    # issue, while pygmentization is by far the most expensive part of rendering an event page.
+    return _pygmentize_lines_cached(tuple(lines), filename, platform)
+
+
+@lru_cache(maxsize=2048)
+def _pygmentize_lines_cached(lines, filename=None, platform=None):
+    # note: the returned list is shared between cache hits; callers treat it as read-only (they slice and re-wrap, but
+    # never mutate in place)
+    if lines == ():
         # special case; sending the empty string to pygments will result in one newline too many
         return []
 
@@ -62,9 +78,14 @@ def _pygmentize_lines(lines, filename=None, platform=None):
     # lines. However, we have seen cases where newlines are present in the code, e.g. in the case of the sentry_sdk's
     # integration w/ Django giving a TemplateSyntaxError (see assets/sentry-sdk-issues/django-templates.md).
     # we also add a space to the empty lines to make sure that they are not removed by the pygments formatter
-    lines = [" " if line == "" else line for line in [l.replace("\n", "") for l in lines]]
+    lines = [l.replace("\n", "") or " " for l in lines]  # `or " "`: the empty string is the only falsy str
     code = "\n".join(lines)
 
+    if not code.strip():
+        # whitespace-only snippets (empty pre/post context around a blank context_line) need no highlighting, and
+        # since they contain no HTML-special characters they need no escaping either; skip pygments entirely.
+        return lines
+
     # [:-1] to remove the last empty line, a result of split()
     result = _core_pygments(code, filename=filename, platform=platform).split('\n')[:-1]
     assert len(lines) == len(result), "%s != %s" % (len(lines), len(result))
@@ -99,9 +120,10 @@ def pygmentize(value, platform):
 
     pre_context, context_lines, post_context = _split(lines, lengths)
 
-    value['pre_context'] = [mark_safe(s) for s in pre_context]
+    # map() over a comprehension: mark_safe is a ready-made callable, so this loops in C
+    value['pre_context'] = list(map(mark_safe, pre_context))
     value['context_line'] = mark_safe(context_lines[0])
-    value['post_context'] = [mark_safe(s) for s in post_context]
+    value['post_context'] = list(map(mark_safe, post_context))
 
     return value
 
@@ -115,11 +137,15 @@ def firstlineno(value):
 
 SHA_RE = re.compile(r"[0-9a-f]+")
 
+# frozenset at module level: issha runs once per release-ish value in the templates, and `in` on a small list both
+# rebuilds the list per call and scans it linearly; a hash lookup does neither.
+SHA_LENGTHS = frozenset([12, 16, 20, 32, 40, 64])
+
 
 @register.filter(name='issha')
 def issha(value):
     """does this look like a sha?"""
-    if len(value) not in [12, 16, 20, 32, 40, 64]:
+    if len(value) not in SHA_LENGTHS:
         return False
 
     if not SHA_RE.fullmatch(value):